@@ -81,6 +81,7 @@ from wraps.result import (
     wrap_result_await_on,
     wrap_result_on,
 )
+from wraps.result_vec import ResultVec
 
 __all__ = (
     # option
@@ -112,6 +113,8 @@ __all__ = (
     "wrap_result_await_on",
     "wrap_result",
     "wrap_result_await",
+    # result vec
+    "ResultVec",
     # either
     "Either",
     "Left",
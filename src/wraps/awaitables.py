@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Awaitable, Generator, TypeVar, final
+
+from typing_extensions import Never
+
+from attrs import frozen
+
+__all__ = ("STOP", "Ready", "Stop")
+
+T = TypeVar("T", covariant=True)
+
+
+@final
+@frozen()
+class Ready(Awaitable[T]):
+    """Represents awaitables that are ready to return their values without suspending.
+
+    Unlike coroutines, instances can be awaited any number of times.
+    """
+
+    value: T
+    """The value to return when awaited."""
+
+    def __await__(self) -> Generator[None, None, T]:
+        return self.value
+        yield
+
+
+@final
+@frozen()
+class Stop(Awaitable[Never]):
+    """Represents awaitables that raise [`StopAsyncIteration`][StopAsyncIteration] when awaited.
+
+    These are returned from `__anext__` to signal exhaustion, since raising
+    from `__anext__` directly violates the asynchronous iterator protocol.
+    """
+
+    def __await__(self) -> Generator[None, None, Never]:
+        raise StopAsyncIteration
+        yield
+
+
+STOP = Stop()
+"""The shared [`Stop`][wraps.awaitables.Stop] instance."""
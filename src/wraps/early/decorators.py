@@ -94,7 +94,7 @@ def early_result(function: ResultCallable[P, T, E]) -> ResultCallable[P, T, E]:
         try:
             return function(*args, **kwargs)
 
-        except EarlyResult[E] as early:
+        except EarlyResult as early:
             return Err(early.error)
 
     return wrap
@@ -116,7 +116,7 @@ def early_result_await(function: ResultAsyncCallable[P, T, E]) -> ResultAsyncCal
         try:
             return await function(*args, **kwargs)
 
-        except EarlyResult[E] as early:
+        except EarlyResult as early:
             return Err(early.error)
 
     return wrap
@@ -42,6 +42,8 @@ E = TypeVar("E")
 
 
 class EitherProtocol(Protocol[L, R]):  # type: ignore[misc]
+    __slots__ = ()
+
     @required
     def is_left(self) -> bool: ...
 
@@ -304,10 +306,10 @@ class Left(EitherProtocol[L, Never]):
         return Right(self.value)
 
     def map_left(self, function: Unary[L, M]) -> Left[M]:
-        return self.create(function(self.value))
+        return Left(function(self.value))
 
     async def map_left_await(self, function: AsyncUnary[L, M]) -> Left[M]:
-        return self.create(await function(self.value))
+        return Left(await function(self.value))
 
     def map_right(self, function: Unary[R, S]) -> Left[L]:
         return self
@@ -316,16 +318,16 @@ class Left(EitherProtocol[L, Never]):
         return self
 
     def map(self: Left[T], function: Unary[T, U]) -> Left[U]:
-        return self.create(function(self.value))
+        return Left(function(self.value))
 
     async def map_await(self: Left[T], function: AsyncUnary[T, U]) -> Left[U]:
-        return self.create(await function(self.value))
+        return Left(await function(self.value))
 
     def map_either(self, left: Unary[L, M], right: Unary[R, S]) -> Left[M]:
-        return self.create(left(self.value))
+        return Left(left(self.value))
 
     async def map_either_await(self, left: AsyncUnary[L, M], right: Unary[R, S]) -> Left[M]:
-        return self.create(await left(self.value))
+        return Left(await left(self.value))
 
     def either(self, left: Unary[L, T], right: Unary[R, T]) -> T:
         return left(self.value)
@@ -364,13 +366,17 @@ class Left(EitherProtocol[L, Never]):
         return async_once(self.value)
 
     def contains_left(self, value: M) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def contains_right(self, value: S) -> Literal[False]:
         return False
 
     def contains(self: Left[T], value: U) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def into_result(self) -> Ok[L]:
         return Ok(self.value)
@@ -473,22 +479,22 @@ class Right(EitherProtocol[Never, R]):
         return self
 
     def map_right(self, function: Unary[R, S]) -> Right[S]:
-        return self.create(function(self.value))
+        return Right(function(self.value))
 
     async def map_right_await(self, function: AsyncUnary[R, S]) -> Right[S]:
-        return self.create(await function(self.value))
+        return Right(await function(self.value))
 
     def map(self: Right[T], function: Unary[T, U]) -> Right[U]:
-        return self.create(function(self.value))
+        return Right(function(self.value))
 
     async def map_await(self: Right[T], function: AsyncUnary[T, U]) -> Right[U]:
-        return self.create(await function(self.value))
+        return Right(await function(self.value))
 
     def map_either(self, left: Unary[L, M], right: Unary[R, S]) -> Right[S]:
-        return self.create(right(self.value))
+        return Right(right(self.value))
 
     async def map_either_await(self, left: AsyncUnary[L, M], right: AsyncUnary[R, S]) -> Right[S]:
-        return self.create(await right(self.value))
+        return Right(await right(self.value))
 
     def either(self, left: Unary[L, T], right: Unary[R, T]) -> T:
         return right(self.value)
@@ -530,10 +536,14 @@ class Right(EitherProtocol[Never, R]):
         return False
 
     def contains_right(self, value: S) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def contains(self: Right[T], value: U) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def into_result(self) -> Err[R]:
         return Err(self.value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, Type, TypeVar, final
+from typing import Generic, Type, TypeVar, Union, final
 
 from attrs import Attribute, field, frozen
 from typing_aliases import AnyError, DynamicTuple, EmptyTuple
@@ -8,7 +8,7 @@ from typing_extensions import Self, TypeIs
 
 from wraps.panics import panic
 
-__all__ = ("RawErrorTypes", "ErrorTypes")
+__all__ = ("RawErrorTypes", "CatchableErrorTypes", "ErrorTypes")
 
 T = TypeVar("T")
 
@@ -22,6 +22,11 @@ E = TypeVar("E", bound=AnyError)
 RawErrorTypes = DynamicTuple[Type[E]]
 """Represents error types. `E` is bound to [`AnyError`][typing_aliases.AnyError]."""
 
+CatchableErrorTypes = Union[Type[E], RawErrorTypes[E]]
+"""Represents error types that can be used in `except` clauses.
+`E` is bound to [`AnyError`][typing_aliases.AnyError].
+"""
+
 EXPECTED_ERROR_TYPES = "`ErrorTypes[E]` expected non-empty `RawErrorTypes[E]`, got `{}`"
 expected_error_types = EXPECTED_ERROR_TYPES.format
 
@@ -47,3 +52,21 @@ class ErrorTypes(Generic[E]):
 
     def extract(self) -> RawErrorTypes[E]:
         return self.raw
+
+    def extract_catchable(self) -> CatchableErrorTypes[E]:
+        """Extracts the error types in the form best suited for `except` clauses.
+
+        Single error types are returned as-is, since matching against classes
+        is faster than matching against tuples.
+
+        Returns:
+            The catchable error types.
+        """
+        raw = self.raw
+
+        if len(raw) == 1:
+            (error_type,) = raw
+
+            return error_type
+
+        return raw
@@ -7,7 +7,7 @@ from funcs.decorators import wraps
 from typing_aliases import AsyncCallable
 from typing_extensions import ParamSpec
 
-from wraps.option import NULL, Option, Some
+from wraps.option import NULL, Option, Some, is_some
 from wraps.reprs import empty_repr
 
 if TYPE_CHECKING:
@@ -32,7 +32,16 @@ class ReAwaitable(Awaitable[T]):
         return empty_repr(self)
 
     def __await__(self) -> Generator[None, None, T]:
-        return self.execute().__await__()
+        result = self._result
+
+        if is_some(result):
+            return result.value
+
+        value = yield from self._awaitable.__await__()
+
+        self._result = Some(value)
+
+        return value
 
     async def execute(self) -> T:
         """Returns the cached result or executes the contained awaitable and caches its result.
@@ -40,16 +49,7 @@ class ReAwaitable(Awaitable[T]):
         Returns:
             The execution result.
         """
-        result = self._result
-
-        if result.is_null():
-            value = await self._awaitable
-
-            self._result = Some(value)
-
-            return value
-
-        return result.unwrap()
+        return await self
 
     @property
     def result(self) -> Option[T]:
@@ -1,29 +1,68 @@
 from __future__ import annotations
 
-from typing import AsyncIterator, Iterator, TypeVar
+from typing import AsyncIterator, Iterator, TypeVar, Union, final
 
 from typing_extensions import Never
 
-__all__ = ("async_empty", "async_once", "empty", "once")
+from wraps.awaitables import STOP, Ready, Stop
+
+__all__ = ("AsyncEmpty", "AsyncOnce", "async_empty", "async_once", "empty", "once")
 
 # NOTE: we can not use `iters` as it depends on `wraps` heavily
 
-T = TypeVar("T")
+T = TypeVar("T", covariant=True)
+U = TypeVar("U")
+
+
+@final
+class AsyncEmpty(AsyncIterator[Never]):
+    """Represents asynchronous iterators that do not yield any items."""
+
+    __slots__ = ()
+
+    def __anext__(self) -> Stop:
+        return STOP
+
+
+@final
+class AsyncOnce(AsyncIterator[T]):
+    """Represents asynchronous iterators that yield exactly one item.
+
+    Items are returned via [`Ready[T]`][wraps.awaitables.Ready], so no coroutines are created.
+    Exhaustion is signaled via [`Stop`][wraps.awaitables.Stop].
+    """
+
+    __slots__ = ("item", "done")
+
+    def __init__(self, item: T) -> None:
+        self.item = item
+        self.done = False
+
+    def __anext__(self) -> Union[Ready[T], Stop]:
+        if self.done:
+            return STOP
+
+        self.done = True
+
+        return Ready(self.item)
+
+
+ASYNC_EMPTY = AsyncEmpty()
+
+EMPTY: Iterator[Never] = iter(())
 
 
-async def async_empty() -> AsyncIterator[Never]:
-    return
-    yield
+def async_empty() -> AsyncIterator[Never]:
+    return ASYNC_EMPTY
 
 
 def empty() -> Iterator[Never]:
-    return
-    yield
+    return EMPTY
 
 
-async def async_once(item: T) -> AsyncIterator[T]:
-    yield item
+def async_once(item: U) -> AsyncIterator[U]:
+    return AsyncOnce(item)
 
 
-def once(item: T) -> Iterator[T]:
-    yield item
+def once(item: U) -> Iterator[U]:
+    return iter((item,))
@@ -58,6 +58,7 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     Literal,
     Optional,
     Protocol,
@@ -122,6 +123,8 @@ E = TypeVar("E")
 
 
 class OptionProtocol(AsyncIterable[T], Iterable[T], Protocol[T]):  # type: ignore[misc]
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[T]:
         return self.iter()
 
@@ -1407,7 +1410,7 @@ class Some(OptionProtocol[T]):
         return self
 
     def map(self, function: Unary[T, U]) -> Some[U]:
-        return self.create(function(self.value))
+        return Some(function(self.value))
 
     def map_or(self, default: U, function: Unary[T, U]) -> U:
         return function(self.value)
@@ -1419,7 +1422,7 @@ class Some(OptionProtocol[T]):
         return function(self.value)
 
     async def map_await(self, function: AsyncUnary[T, U]) -> Some[U]:
-        return self.create(await function(self.value))
+        return Some(await function(self.value))
 
     async def map_await_or(self, default: U, function: AsyncUnary[T, U]) -> U:
         return await function(self.value)
@@ -1466,7 +1469,7 @@ class Some(OptionProtocol[T]):
         return self
 
     def xor(self, option: Option[T]) -> Option[T]:
-        return self if is_null(option) else NULL
+        return self if type(option) is Null else NULL
 
     @overload
     def zip(self, option: Null) -> Null: ...
@@ -1478,7 +1481,7 @@ class Some(OptionProtocol[T]):
     def zip(self, option: Option[U]) -> Option[Tuple[T, U]]: ...
 
     def zip(self, option: Option[U]) -> Option[Tuple[T, U]]:
-        return self.create((self.value, option.value)) if is_some(option) else NULL
+        return Some((self.value, option.value)) if type(option) is Some else NULL
 
     @overload
     def zip_with(self, option: Null, function: Binary[T, U, V]) -> Null: ...
@@ -1490,7 +1493,7 @@ class Some(OptionProtocol[T]):
     def zip_with(self, option: Option[U], function: Binary[T, U, V]) -> Option[V]: ...
 
     def zip_with(self, option: Option[U], function: Binary[T, U, V]) -> Option[V]:
-        return self.create(function(self.value, option.value)) if is_some(option) else NULL
+        return Some(function(self.value, option.value)) if type(option) is Some else NULL
 
     @overload
     async def zip_with_await(self, option: Null, function: AsyncBinary[T, U, V]) -> Null: ...
@@ -1504,15 +1507,17 @@ class Some(OptionProtocol[T]):
     ) -> Option[V]: ...
 
     async def zip_with_await(self, option: Option[U], function: AsyncBinary[T, U, V]) -> Option[V]:
-        return self.create(await function(self.value, option.value)) if is_some(option) else NULL
+        return Some(await function(self.value, option.value)) if type(option) is Some else NULL
 
     def unzip(self: Some[Tuple[U, V]]) -> Tuple[Some[U], Some[V]]:
         u, v = self.value
 
-        return self.create(u), self.create(v)
+        return Some(u), Some(v)
 
     def contains(self, value: U) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def early(self) -> T:
         return self.value
@@ -1531,14 +1536,14 @@ def is_some(option: Option[T]) -> TypeIs[Some[T]]:
     """This is the same as [`Option.is_some`][wraps.option.OptionProtocol.is_some],
     except it works as a *type guard*.
     """
-    return option.is_some()
+    return type(option) is Some
 
 
 def is_null(option: Option[T]) -> TypeIs[Null]:
     """This is the same as [`Option.is_null`][wraps.option.OptionProtocol.is_null],
     except it works as a *type guard*.
     """
-    return option.is_null()
+    return type(option) is Null
 
 
 def wrap_optional(optional: Optional[T]) -> Option[T]:
@@ -1584,16 +1589,54 @@ class WrapOption(Generic[A]):
     """The error types to handle. See [`ErrorTypes[A]`][wraps.errors.ErrorTypes]."""
 
     def __call__(self, function: Callable[P, T]) -> OptionCallable[P, T]:
+        error_types = self.error_types.extract_catchable()
+
         @wraps(function)
         def wrap(*args: P.args, **kwargs: P.kwargs) -> Option[T]:
             try:
                 return Some(function(*args, **kwargs))
 
-            except self.error_types.extract():
+            except error_types:
                 return NULL
 
         return wrap
 
+    def map(self, function: Unary[T, U], iterable: Iterable[T]) -> List[Option[U]]:
+        """Applies the `function` to each item of the `iterable`, wrapping the outcomes
+        into [`Option[U]`][wraps.option.Option] values.
+
+        This is equivalent to calling the decorated `function` on each item,
+        except that the loop runs without entering the wrapper for every item.
+
+        Example:
+            ```python
+            options = wrap_option_on(ValueError).map(int, ["42", "owo"])
+
+            assert options == [Some(42), NULL]
+            ```
+
+        Arguments:
+            function: The function to apply.
+            iterable: The items to apply the function to.
+
+        Returns:
+            The list of options, in the order of the items.
+        """
+        error_types = self.error_types.extract_catchable()
+
+        options: List[Option[U]] = []
+
+        append = options.append
+
+        for item in iterable:
+            try:
+                append(Some(function(item)))
+
+            except error_types:
+                append(NULL)
+
+        return options
+
 
 def wrap_option_on(head: Type[A], *tail: Type[A]) -> WrapOption[A]:
     """Creates [`WrapOption[A]`][wraps.option.WrapOption] decorators.
@@ -1617,7 +1660,7 @@ def wrap_option_on(head: Type[A], *tail: Type[A]) -> WrapOption[A]:
     Returns:
         The [`WrapOption[A]`][wraps.option.WrapOption] decorator created.
     """
-    return WrapOption(ErrorTypes[A].from_head_and_tail(head, *tail))
+    return WrapOption(ErrorTypes.from_head_and_tail(head, *tail))
 
 
 wrap_option = wrap_option_on(NormalError)
@@ -1641,12 +1684,14 @@ class WrapOptionAwait(Generic[A]):
     """The error types to handle. See [`ErrorTypes[A]`][wraps.errors.ErrorTypes]."""
 
     def __call__(self, function: AsyncCallable[P, T]) -> OptionAsyncCallable[P, T]:
+        error_types = self.error_types.extract_catchable()
+
         @wraps(function)
         async def wrap(*args: P.args, **kwargs: P.kwargs) -> Option[T]:
             try:
                 return Some(await function(*args, **kwargs))
 
-            except self.error_types.extract():
+            except error_types:
                 return NULL
 
         return wrap
@@ -1674,7 +1719,7 @@ def wrap_option_await_on(head: Type[A], *tail: Type[A]) -> WrapOptionAwait[A]:
     Returns:
         The [`WrapOptionAwait[A]`][wraps.option.WrapOptionAwait] decorator created.
     """
-    return WrapOptionAwait(ErrorTypes[A].from_head_and_tail(head, *tail))
+    return WrapOptionAwait(ErrorTypes.from_head_and_tail(head, *tail))
 
 
 wrap_option_await = wrap_option_await_on(NormalError)
@@ -46,13 +46,14 @@ from __future__ import annotations
 
 from typing import (
     TYPE_CHECKING,
-    AsyncIterable,
+    Any,
     AsyncIterator,
     Generic,
     Iterable,
     Iterator,
+    List,
     Literal,
-    Protocol,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -60,6 +61,7 @@ from typing import (
 )
 
 from attrs import frozen
+from attrs.exceptions import FrozenInstanceError
 from funcs.decorators import wraps
 from funcs.functions import identity
 from typing_aliases import (
@@ -79,7 +81,7 @@ from typing_aliases import (
 from typing_extensions import Callable, Never, ParamSpec, TypeIs
 
 from wraps.errors import ErrorTypes
-from wraps.iters import async_empty, async_once, empty, once
+from wraps.iters import ASYNC_EMPTY, EMPTY, AsyncOnce
 from wraps.panics import panic
 from wraps.reprs import wrap_repr
 
@@ -108,7 +110,9 @@ F = TypeVar("F")
 V = TypeVar("V")
 
 
-class ResultProtocol(AsyncIterable[T], Iterable[T], Protocol[T, E]):  # type: ignore[misc]
+class ResultProtocol(Generic[T, E]):
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[T]:
         return self.iter()
 
@@ -1516,6 +1520,9 @@ class ResultProtocol(AsyncIterable[T], Iterable[T], Protocol[T, E]):  # type: ig
         of whether or not that result is [`Ok[V]`][wraps.result.Ok]
         or [`Err[V]`][wraps.result.Err].
 
+        This is equivalent to accessing `result.value` directly, which avoids the method call
+        in hot code; the method exists to make the `Result[V, V]` requirement explicit.
+
         Example:
             ```python
             result: Result[int, int] = Ok(69)
@@ -1573,17 +1580,54 @@ class ResultProtocol(AsyncIterable[T], Iterable[T], Protocol[T, E]):  # type: ig
 UNWRAP_ON_ERR = "called `unwrap` on err"
 UNWRAP_ERR_ON_OK = "called `unwrap_err` on ok"
 
+VALUE = "value"
+
 
 @final
-@frozen()
 class Ok(ResultProtocol[T, Never]):
     """[`Ok[T]`][wraps.result.Ok] variant of [`Result[T, E]`][wraps.result.Result]."""
 
-    value: T
+    __slots__ = ("value", "__weakref__")
+
+    __match_args__ = ("value",)
+
+    if TYPE_CHECKING:  # read-only for type checkers; stored in the slot at runtime
+
+        @property
+        def value(self) -> T: ...
+
+    def __init__(self, value: T) -> None:
+        set_ok_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> Never:
+        raise FrozenInstanceError
+
+    def __delattr__(self, name: str) -> Never:
+        raise FrozenInstanceError
+
+    def __reduce__(self) -> Tuple[Type[Ok[T]], Tuple[T]]:
+        return (type(self), (self.value,))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter((self.value,))
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return AsyncOnce(self.value)
 
     def __repr__(self) -> str:
         return wrap_repr(self, self.value)
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) is Ok:
+            value: object = other.value
+
+            return self.value == value
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Ok, self.value))
+
     @classmethod
     def create(cls, value: U) -> Ok[U]:
         return cls(value)  # type: ignore[arg-type, return-value]
@@ -1677,7 +1721,7 @@ class Ok(ResultProtocol[T, Never]):
         return self
 
     def map(self, function: Unary[T, U]) -> Ok[U]:
-        return self.create(function(self.value))
+        return Ok(function(self.value))
 
     def map_or(self, default: U, function: Unary[T, U]) -> U:
         return function(self.value)
@@ -1701,7 +1745,7 @@ class Ok(ResultProtocol[T, Never]):
         return await default()
 
     async def map_await(self, function: AsyncUnary[T, U]) -> Ok[U]:
-        return self.create(await function(self.value))
+        return Ok(await function(self.value))
 
     async def map_await_or(self, default: U, function: AsyncUnary[T, U]) -> U:
         return await function(self.value)
@@ -1729,16 +1773,16 @@ class Ok(ResultProtocol[T, Never]):
         return await default()
 
     def iter(self) -> Iterator[T]:
-        return once(self.value)
+        return iter((self.value,))
 
     def iter_err(self) -> Iterator[Never]:
-        return empty()
+        return EMPTY
 
     def async_iter(self) -> AsyncIterator[T]:
-        return async_once(self.value)
+        return AsyncOnce(self.value)
 
     def async_iter_err(self) -> AsyncIterator[Never]:
-        return async_empty()
+        return ASYNC_EMPTY
 
     def and_then(self, function: Unary[T, Result[U, E]]) -> Result[U, E]:
         return function(self.value)
@@ -1753,7 +1797,9 @@ class Ok(ResultProtocol[T, Never]):
         return self
 
     def contains(self, value: U) -> bool:
-        return self.value == value
+        contained = self.value
+
+        return contained is value or contained == value
 
     def contains_err(self, error: F) -> Literal[False]:
         return False
@@ -1761,6 +1807,12 @@ class Ok(ResultProtocol[T, Never]):
     def flip(self) -> Err[T]:
         return Err(self.value)
 
+    def try_flatten(self: Ok[Result[U, F]]) -> Result[U, F]:
+        return self.value
+
+    def try_flatten_err(self) -> Ok[T]:
+        return self
+
     def into_ok_or_err(self: Ok[V]) -> V:
         return self.value
 
@@ -1771,12 +1823,39 @@ class Ok(ResultProtocol[T, Never]):
         return self.value
 
 
+set_ok_value = vars(Ok)[VALUE].__set__
+
+
 @final
-@frozen()
 class Err(ResultProtocol[Never, E]):
     """[`Err[E]`][wraps.result.Err] variant of [`Result[T, E]`][wraps.result.Result]."""
 
-    value: E
+    __slots__ = ("value", "__weakref__")
+
+    __match_args__ = ("value",)
+
+    if TYPE_CHECKING:  # read-only for type checkers; stored in the slot at runtime
+
+        @property
+        def value(self) -> E: ...
+
+    def __init__(self, value: E) -> None:
+        set_err_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> Never:
+        raise FrozenInstanceError
+
+    def __delattr__(self, name: str) -> Never:
+        raise FrozenInstanceError
+
+    def __reduce__(self) -> Tuple[Type[Err[E]], Tuple[E]]:
+        return (type(self), (self.value,))
+
+    def __iter__(self) -> Iterator[Never]:
+        return EMPTY
+
+    def __aiter__(self) -> AsyncIterator[Never]:
+        return ASYNC_EMPTY
 
     def __bool__(self) -> Literal[False]:
         return False
@@ -1784,6 +1863,17 @@ class Err(ResultProtocol[Never, E]):
     def __repr__(self) -> str:
         return wrap_repr(self, self.value)
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) is Err:
+            value: object = other.value
+
+            return self.value == value
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Err, self.value))
+
     @classmethod
     def create(cls, error: F) -> Err[F]:
         return cls(error)  # type: ignore[arg-type, return-value]
@@ -1886,7 +1976,7 @@ class Err(ResultProtocol[Never, E]):
         return default()
 
     def map_err(self, function: Unary[E, F]) -> Err[F]:
-        return self.create(function(self.value))
+        return Err(function(self.value))
 
     def map_err_or(self, default: F, function: Unary[E, F]) -> F:
         return function(self.value)
@@ -1915,7 +2005,7 @@ class Err(ResultProtocol[Never, E]):
         return await default()
 
     async def map_err_await(self, function: AsyncUnary[E, F]) -> Err[F]:
-        return self.create(await function(self.value))
+        return Err(await function(self.value))
 
     async def map_err_await_or(self, default: F, function: AsyncUnary[E, F]) -> F:
         return await function(self.value)
@@ -1929,16 +2019,16 @@ class Err(ResultProtocol[Never, E]):
         return await function(self.value)
 
     def iter(self) -> Iterator[Never]:
-        return empty()
+        return EMPTY
 
     def iter_err(self) -> Iterator[E]:
-        return once(self.value)
+        return iter((self.value,))
 
     def async_iter(self) -> AsyncIterator[Never]:
-        return async_empty()
+        return ASYNC_EMPTY
 
     def async_iter_err(self) -> AsyncIterator[E]:
-        return async_once(self.value)
+        return AsyncOnce(self.value)
 
     def and_then(self, function: Unary[T, Result[U, E]]) -> Err[E]:
         return self
@@ -1956,11 +2046,19 @@ class Err(ResultProtocol[Never, E]):
         return False
 
     def contains_err(self, error: F) -> bool:
-        return self.value == error
+        contained = self.value
+
+        return contained is error or contained == error
 
     def flip(self) -> Ok[E]:
         return Ok(self.value)
 
+    def try_flatten(self) -> Err[E]:
+        return self
+
+    def try_flatten_err(self: Err[Result[U, F]]) -> Result[U, F]:
+        return self.value
+
     def into_ok_or_err(self: Err[V]) -> V:
         return self.value
 
@@ -1971,6 +2069,9 @@ class Err(ResultProtocol[Never, E]):
         raise EarlyResult(self.value)
 
 
+set_err_value = vars(Err)[VALUE].__set__
+
+
 Result = Union[Ok[T], Err[E]]
 """Result value, expressed as the union of [`Ok[T]`][wraps.result.Ok]
 and [`Err[E]`][wraps.result.Err].
@@ -1981,14 +2082,14 @@ def is_ok(result: Result[T, E]) -> TypeIs[Ok[T]]:
     """This is the same as [`Result.is_ok`][wraps.result.ResultProtocol.is_ok],
     except it works as a *type guard*.
     """
-    return result.is_ok()
+    return type(result) is Ok
 
 
 def is_err(result: Result[T, E]) -> TypeIs[Err[E]]:
     """This is the same as [`Result.is_err`][wraps.result.ResultProtocol.is_err],
     except it works as a *type guard*.
     """
-    return result.is_err()
+    return type(result) is Err
 
 
 # import cycle solution
@@ -2020,16 +2121,55 @@ class WrapResult(Generic[A]):
     """The error types to handle. See [`ErrorTypes[A]`][wraps.errors.ErrorTypes]."""
 
     def __call__(self, function: Callable[P, T]) -> ResultCallable[P, T, A]:
+        error_types = self.error_types.extract_catchable()
+
         @wraps(function)
         def wrap(*args: P.args, **kwargs: P.kwargs) -> Result[T, A]:
             try:
                 return Ok(function(*args, **kwargs))
 
-            except self.error_types.extract() as error:
+            except error_types as error:
                 return Err(error)
 
         return wrap
 
+    def map(self, function: Unary[T, U], iterable: Iterable[T]) -> List[Result[U, A]]:
+        """Applies the `function` to each item of the `iterable`, wrapping the outcomes
+        into [`Result[U, A]`][wraps.result.Result] values.
+
+        This is equivalent to calling the decorated `function` on each item,
+        except that the loop runs without entering the wrapper for every item.
+
+        Example:
+            ```python
+            results = wrap_result_on(ValueError).map(int, ["42", "owo"])
+
+            assert results[0] == Ok(42)
+            assert results[1].is_err()
+            ```
+
+        Arguments:
+            function: The function to apply.
+            iterable: The items to apply the function to.
+
+        Returns:
+            The list of results, in the order of the items.
+        """
+        error_types = self.error_types.extract_catchable()
+
+        results: List[Result[U, A]] = []
+
+        append = results.append
+
+        for item in iterable:
+            try:
+                append(Ok(function(item)))
+
+            except error_types as error:
+                append(Err(error))
+
+        return results
+
 
 def wrap_result_on(head: Type[A], *tail: Type[A]) -> WrapResult[A]:
     """Creates [`WrapResult[A]`][wraps.result.WrapResult] decorators.
@@ -2053,7 +2193,7 @@ def wrap_result_on(head: Type[A], *tail: Type[A]) -> WrapResult[A]:
     Returns:
         The [`WrapResult[A]`][wraps.result.WrapResult] decorator created.
     """
-    return WrapResult(ErrorTypes[A].from_head_and_tail(head, *tail))
+    return WrapResult(ErrorTypes.from_head_and_tail(head, *tail))
 
 
 wrap_result = wrap_result_on(NormalError)
@@ -2077,12 +2217,14 @@ class WrapResultAwait(Generic[A]):
     """The error types to handle. See [`ErrorTypes[A]`][wraps.errors.ErrorTypes]."""
 
     def __call__(self, function: AsyncCallable[P, T]) -> ResultAsyncCallable[P, T, A]:
+        error_types = self.error_types.extract_catchable()
+
         @wraps(function)
         async def wrap(*args: P.args, **kwargs: P.kwargs) -> Result[T, A]:
             try:
                 return Ok(await function(*args, **kwargs))
 
-            except self.error_types.extract() as error:
+            except error_types as error:
                 return Err(error)
 
         return wrap
@@ -2110,7 +2252,7 @@ def wrap_result_await_on(head: Type[A], *tail: Type[A]) -> WrapResultAwait[A]:
     Returns:
         The [`WrapResultAwait[A]`][wraps.result.WrapResultAwait] decorator created.
     """
-    return WrapResultAwait(ErrorTypes[A].from_head_and_tail(head, *tail))
+    return WrapResultAwait(ErrorTypes.from_head_and_tail(head, *tail))
 
 
 wrap_result_await = wrap_result_await_on(NormalError)
@@ -0,0 +1,274 @@
+"""Columnar storage of results.
+
+[`ResultVec[T, E]`][wraps.result_vec.ResultVec] stores many results in the
+*struct of arrays* layout: one [`bytearray`][bytearray] of tags, telling
+[`Ok[T]`][wraps.result.Ok] and [`Err[E]`][wraps.result.Err] apart,
+and one [`list`][list] of the contained values.
+
+Bulk operations only scan the tags and the values, without creating
+intermediate result objects for every element.
+
+```python
+from wraps import Err, Ok, ResultVec
+
+vec = ResultVec.from_results([Ok(1), Err("error"), Ok(3)])
+
+print(vec.map(str).unwrap_or("default"))  # ['1', 'default', '3']
+```
+
+Since the tags are stored in a [`bytearray`][bytearray], they support the buffer protocol,
+which allows vectorized libraries to use them without copying. For instance, with `numpy`:
+
+```python
+import numpy as np
+
+from wraps.result_vec import OK
+
+vec = ResultVec.from_results([Ok(1.0), Err("error"), Ok(3.0)])
+
+is_ok = np.frombuffer(vec.tags, dtype=np.uint8) == OK
+values = np.array(vec.values, dtype=object)
+
+print(np.where(is_ok, values, 0.0))  # [1.0 0.0 3.0]
+```
+"""
+
+from __future__ import annotations
+
+from itertools import compress
+from typing import Generic, Iterable, Iterator, List, Tuple, TypeVar, Union, final, overload
+
+from attrs import Attribute, define, field
+from typing_aliases import Unary
+
+from wraps.panics import panic
+from wraps.result import Err, Ok, Result, is_ok
+
+__all__ = ("OK", "ERR", "ResultVec")
+
+OK = 0
+"""The tag of [`Ok[T]`][wraps.result.Ok] values."""
+
+ERR = 1
+"""The tag of [`Err[E]`][wraps.result.Err] values."""
+
+TAGS = bytes((OK, ERR))
+
+SWAP_TAGS = bytes.maketrans(TAGS, bytes((ERR, OK)))
+
+EXPECTED_TAGS = "`ResultVec[T, E]` expected `OK` ({ok}) or `ERR` ({err}) tags, got {tag}"
+expected_tags = EXPECTED_TAGS.format
+
+EXPECTED_VALUES = "`ResultVec[T, E]` expected {expected} values, got {actual}"
+expected_values = EXPECTED_VALUES.format
+
+EXPECTED_MAPPED = "`map_batch` expected {expected} mapped values, got {actual}"
+expected_mapped = EXPECTED_MAPPED.format
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+E = TypeVar("E")
+F = TypeVar("F")
+
+
+@final
+@define()
+class ResultVec(Generic[T, E]):
+    """Represents sequences of [`Result[T, E]`][wraps.result.Result] values
+    stored in the columnar layout.
+
+    Creating vectors panics if the tags and the values differ in length,
+    or if any of the tags is neither [`OK`][wraps.result_vec.OK] nor [`ERR`][wraps.result_vec.ERR].
+    """
+
+    tags: bytearray = field(factory=bytearray)
+    """The tags of the results, either [`OK`][wraps.result_vec.OK]
+    or [`ERR`][wraps.result_vec.ERR].
+    """
+
+    values: List[Union[T, E]] = field(factory=list)
+    """The values contained in the results."""
+
+    @tags.validator
+    def check_tags(self, attribute: Attribute[bytearray], value: bytearray) -> None:
+        invalid = value.translate(None, TAGS)
+
+        if invalid:
+            panic(expected_tags(ok=OK, err=ERR, tag=invalid[0]))
+
+    @values.validator
+    def check_values(
+        self, attribute: Attribute[List[Union[T, E]]], value: List[Union[T, E]]
+    ) -> None:
+        expected = len(self.tags)
+        actual = len(value)
+
+        if actual != expected:
+            panic(expected_values(expected=expected, actual=actual))
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[U, F]]) -> ResultVec[U, F]:
+        """Creates [`ResultVec[U, F]`][wraps.result_vec.ResultVec] from the `results` given.
+
+        Arguments:
+            results: The results to store.
+
+        Returns:
+            The columnar vector of results.
+        """
+        vec: ResultVec[U, F] = cls()  # type: ignore[assignment]
+
+        for result in results:
+            vec.append(result)
+
+        return vec
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        for tag, value in zip(self.tags, self.values):
+            yield Ok(value) if tag == OK else Err(value)  # type: ignore[arg-type]
+
+    @overload
+    def __getitem__(self, index: int) -> Result[T, E]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ResultVec[T, E]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Result[T, E], ResultVec[T, E]]:
+        if type(index) is slice:
+            return ResultVec(self.tags[index], self.values[index])
+
+        value = self.values[index]
+
+        return Ok(value) if self.tags[index] == OK else Err(value)  # type: ignore[arg-type]
+
+    def append(self, result: Result[T, E]) -> None:
+        """Appends the `result` to the vector.
+
+        Arguments:
+            result: The result to append.
+        """
+        self.tags.append(OK if is_ok(result) else ERR)
+        self.values.append(result.value)
+
+    def map(self, function: Unary[T, U]) -> ResultVec[U, E]:
+        """Applies the `function` to every contained [`Ok[T]`][wraps.result.Ok] value,
+        leaving [`Err[E]`][wraps.result.Err] values untouched.
+
+        Arguments:
+            function: The function to apply.
+
+        Returns:
+            The mapped vector.
+        """
+        values = [
+            function(value) if tag == OK else value  # type: ignore[arg-type]
+            for tag, value in zip(self.tags, self.values)
+        ]
+
+        return ResultVec(self.tags.copy(), values)  # type: ignore[arg-type]
+
+    def map_batch(self, function: Unary[List[T], Iterable[U]]) -> ResultVec[U, E]:
+        """Applies the `function` to all contained [`Ok[T]`][wraps.result.Ok] values at once,
+        leaving [`Err[E]`][wraps.result.Err] values untouched.
+
+        The `function` is called exactly once, which allows using vectorized implementations.
+        For instance, with `numpy`:
+
+        ```python
+        vec = ResultVec.from_results([Ok(1.0), Err("error"), Ok(4.0)])
+
+        mapped = vec.map_batch(lambda values: np.sqrt(values).tolist())
+
+        print(mapped.unwrap_or(0.0))  # [1.0, 0.0, 2.0]
+        ```
+
+        Arguments:
+            function: The function to apply, returning one value per value given.
+
+        Raises:
+            Panic: The `function` returned the wrong number of values.
+
+        Returns:
+            The mapped vector.
+        """
+        tags = self.tags
+        values = self.values
+
+        oks = list(compress(values, tags.translate(SWAP_TAGS)))
+
+        mapped = list(function(oks))  # type: ignore[arg-type]
+
+        expected = len(oks)
+        actual = len(mapped)
+
+        if actual != expected:
+            panic(expected_mapped(expected=expected, actual=actual))
+
+        iterator = iter(mapped)
+
+        mapped_values = [next(iterator) if tag == OK else value for tag, value in zip(tags, values)]
+
+        return ResultVec(tags.copy(), mapped_values)  # type: ignore[arg-type]
+
+    def map_err(self, function: Unary[E, F]) -> ResultVec[T, F]:
+        """Applies the `function` to every contained [`Err[E]`][wraps.result.Err] value,
+        leaving [`Ok[T]`][wraps.result.Ok] values untouched.
+
+        Arguments:
+            function: The function to apply.
+
+        Returns:
+            The mapped vector.
+        """
+        values = [
+            value if tag == OK else function(value)  # type: ignore[arg-type]
+            for tag, value in zip(self.tags, self.values)
+        ]
+
+        return ResultVec(self.tags.copy(), values)  # type: ignore[arg-type]
+
+    def unwrap_or(self, default: T) -> List[T]:
+        """Returns the contained [`Ok[T]`][wraps.result.Ok] values,
+        replacing [`Err[E]`][wraps.result.Err] ones with the `default`.
+
+        Arguments:
+            default: The default value to use.
+
+        Returns:
+            The list of values.
+        """
+        return [
+            value if tag == OK else default  # type: ignore[misc]
+            for tag, value in zip(self.tags, self.values)
+        ]
+
+    def partition(self) -> Tuple[List[T], List[E]]:
+        """Partitions the vector into the contained [`Ok[T]`][wraps.result.Ok]
+        and [`Err[E]`][wraps.result.Err] values, preserving their order.
+
+        Both passes are driven by the tags, so no result objects are created.
+
+        Example:
+            ```python
+            vec = ResultVec.from_results([Ok(1), Err("error"), Ok(3)])
+
+            assert vec.partition() == ([1, 3], ["error"])
+            ```
+
+        Returns:
+            The tuple of contained [`Ok[T]`][wraps.result.Ok]
+            and [`Err[E]`][wraps.result.Err] values.
+        """
+        tags = self.tags
+        values = self.values
+
+        # `OK` tags are zero, so `ERR` tags select errors, and swapped tags select values
+
+        oks = list(compress(values, tags.translate(SWAP_TAGS)))
+        errs = list(compress(values, tags))
+
+        return (oks, errs)  # type: ignore[return-value]
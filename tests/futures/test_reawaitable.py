@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List
+
 import pytest
 from wraps.futures.reawaitable import wrap_reawaitable
 
@@ -23,3 +25,22 @@ async def test_reawaitable() -> None:
     assert reawaitable.result.unwrap() == value  # ... correctly
 
     assert await reawaitable == value  # reawaitable
+
+
+@pytest.mark.anyio
+async def test_reawaitable_executes_once() -> None:
+    calls: List[None] = []
+
+    @wrap_reawaitable
+    async def record() -> int:
+        calls.append(None)
+
+        return len(calls)
+
+    reawaitable = record()
+
+    assert await reawaitable == 1
+    assert await reawaitable == 1
+    assert await reawaitable.execute() == 1  # shares the cached result
+
+    assert len(calls) == 1
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import List
+
+from wraps.early.decorators import early_option, early_result
+from wraps.early.errors import EarlyResult
+from wraps.option import NULL, Option, Some
+from wraps.result import Err, Ok, Result
+
+
+@early_option
+def add_early(left: Option[int], right: Option[int]) -> Option[int]:
+    return Some(left.early() + right.early())
+
+
+def test_early_option() -> None:
+    assert add_early(Some(1), Some(2)) == Some(3)
+
+    assert add_early(NULL, Some(2)) == NULL
+    assert add_early(Some(1), NULL) == NULL
+
+
+@early_result
+def propagate(result: Result[int, str]) -> Result[int, str]:
+    return Err(str(result.early()))
+
+
+def test_early_result_saved() -> None:
+    saved: List[BaseException] = []
+
+    @early_result
+    def propagate_saving(result: Result[int, str]) -> Result[int, str]:
+        try:
+            return Ok(result.early())
+
+        except BaseException as error:
+            saved.append(error)
+
+            raise
+
+    assert propagate_saving(Err("error")) == Err("error")
+
+    (early,) = saved
+
+    assert isinstance(early, EarlyResult)
+    assert early.error == "error"  # not cleared by the decorator
+
+
+@early_result
+def propagate_with_cleanup(result: Result[int, str]) -> Result[int, str]:
+    try:
+        return Ok(result.early())
+
+    finally:
+        propagate(Err("cleanup"))  # returns early while the outer early return propagates
+
+
+def test_early_result_reentrant() -> None:
+    assert propagate_with_cleanup(Err("error")) == Err("error")
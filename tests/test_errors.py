@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from wraps.errors import ErrorTypes
+
+
+def test_extract_catchable() -> None:
+    assert ErrorTypes.from_head_and_tail(ValueError).extract_catchable() is ValueError
+
+    error_types = ErrorTypes.from_head_and_tail(ValueError, TypeError)
+
+    assert error_types.extract_catchable() == (ValueError, TypeError)
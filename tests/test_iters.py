@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from typing import AsyncIterator, List, TypeVar
+
+import pytest
+from wraps.iters import async_empty, async_once, empty, once
+
+T = TypeVar("T")
+
+
+async def async_list(iterator: AsyncIterator[T]) -> List[T]:
+    return [item async for item in iterator]
+
+
+def test_once_and_empty() -> None:
+    assert list(once(42)) == [42]
+    assert list(empty()) == []
+
+    assert empty() is empty()  # exhausted iterators are shared
+
+
+@pytest.mark.anyio
+async def test_async_once_and_empty() -> None:
+    assert await async_list(async_once(42)) == [42]
+    assert await async_list(async_empty()) == []
+
+    iterator = async_once(13)
+
+    assert await iterator.__anext__() == 13
+
+    with pytest.raises(StopAsyncIteration):
+        await iterator.__anext__()
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="`anext` was added in Python 3.10")
+async def test_anext_default() -> None:
+    empty_iterator: AsyncIterator[int] = async_empty()
+
+    assert await anext(empty_iterator, None) is None
+
+    iterator = async_once(42)
+
+    assert await anext(iterator, None) == 42
+    assert await anext(iterator, None) is None
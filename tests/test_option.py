@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from inspect import iscoroutine
+from typing import Any
+
+import pytest
+from wraps.option import NULL, Some, is_null, is_some, wrap_option_on
+
+
+def test_is_some_is_null() -> None:
+    assert is_some(Some(42))
+    assert not is_some(NULL)
+
+    assert is_null(NULL)
+    assert not is_null(Some(42))
+
+
+def test_zip() -> None:
+    assert Some(1).zip(Some(2)) == Some((1, 2))
+    assert Some(1).zip(NULL) == NULL
+
+
+def test_slots() -> None:
+    assert not hasattr(Some(42), "__dict__")
+    assert not hasattr(NULL, "__dict__")
+
+
+async def is_even(value: int) -> bool:
+    return not value % 2
+
+
+@pytest.mark.anyio
+async def test_null_await() -> None:
+    assert await NULL.is_some_and_await(is_even) is False
+    assert await NULL.filter_await(is_even) is NULL
+
+    assert await Some(2).is_some_and_await(is_even)
+    assert await Some(3).filter_await(is_even) is NULL
+
+
+def test_await_methods_return_coroutines() -> None:
+    coroutines = (
+        Some(2).is_some_and_await(is_even),
+        NULL.is_some_and_await(is_even),
+        Some(2).filter_await(is_even),
+        NULL.filter_await(is_even),
+    )
+
+    for coroutine in coroutines:
+        assert iscoroutine(coroutine)  # regardless of the variant
+
+        coroutine.close()
+
+
+def test_xor() -> None:
+    assert Some(1).xor(NULL) == Some(1)
+    assert Some(1).xor(Some(2)) == NULL
+
+
+@wrap_option_on(ValueError)
+def parse(string: str) -> int:
+    return int(string)
+
+
+def test_wrap_option() -> None:
+    assert parse("42") == Some(42)
+    assert parse("owo").is_null()
+
+    assert parse.__name__ == "parse"
+
+
+def to_int(value: Any) -> int:
+    return int(value)
+
+
+def test_wrap_option_map() -> None:
+    assert wrap_option_on(ValueError).map(to_int, ["42", "owo"]) == [Some(42), NULL]
+
+    with pytest.raises(TypeError):
+        wrap_option_on(ValueError).map(to_int, [None])
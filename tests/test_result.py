@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import pickle
+from copy import copy
+from inspect import iscoroutine
+from typing import Any, List
+from unittest.mock import ANY
+from weakref import ref
+
+import pytest
+from wraps.early.decorators import early_result
+from wraps.result import Err, Ok, Result, is_err, is_ok, wrap_result_on
+
+DIVISION_BY_ZERO = "division by zero"
+
+
+async def inverse(value: float) -> Result[float, str]:
+    return Ok(1.0 / value) if value else Err(DIVISION_BY_ZERO)
+
+
+async def recover(error: str) -> Result[float, str]:
+    return Ok(0.0)
+
+
+@pytest.mark.anyio
+async def test_and_then_await() -> None:
+    assert await Ok(2.0).and_then_await(inverse) == Ok(0.5)
+    assert await Ok(0.0).and_then_await(inverse) == Err(DIVISION_BY_ZERO)
+
+    err = Err(DIVISION_BY_ZERO)
+
+    assert await err.and_then_await(inverse) is err
+
+
+@pytest.mark.anyio
+async def test_or_else_await() -> None:
+    assert await Err(DIVISION_BY_ZERO).or_else_await(recover) == Ok(0.0)
+
+    ok = Ok(1.0)
+
+    assert await ok.or_else_await(recover) is ok
+
+
+async def halve(value: float) -> float:
+    return value / 2.0
+
+
+async def length(string: str) -> int:
+    return len(string)
+
+
+async def default() -> float:
+    return 0.0
+
+
+async def zero() -> int:
+    return 0
+
+
+def divide_by_zero() -> float:
+    return 1.0 / 0.0
+
+
+async def is_positive(value: float) -> bool:
+    return value > 0
+
+
+def test_await_methods_return_coroutines() -> None:
+    ok = Ok(2.0)
+    err = Err(DIVISION_BY_ZERO)
+
+    coroutines = (
+        ok.and_then_await(inverse),
+        err.and_then_await(inverse),
+        ok.or_else_await(recover),
+        err.or_else_await(recover),
+        ok.map_await(halve),
+        err.map_await(halve),
+        ok.map_err_await(length),
+        err.map_err_await(length),
+        ok.unwrap_or_else_await(default),
+        err.unwrap_or_else_await(default),
+        ok.map_await_or(0.0, halve),
+        err.map_await_or(0.0, halve),
+        ok.map_or_else_await(zero, int),
+        err.map_or_else_await(zero, int),
+        ok.map_await_or_else(divide_by_zero, halve),
+        err.map_await_or_else(divide_by_zero, halve),
+        ok.is_ok_and_await(is_positive),
+        err.is_ok_and_await(is_positive),
+    )
+
+    for coroutine in coroutines:
+        assert iscoroutine(coroutine)  # regardless of the variant
+
+        coroutine.close()
+
+
+def test_equality() -> None:
+    value = 42
+
+    assert Ok(value) == Ok(value)
+    assert Err(value) == Err(value)
+
+    assert Ok(value) != Err(value)
+    assert Err(value) != Ok(value)
+
+    assert hash(Ok(value)) == hash(Ok(value))
+    assert hash(Ok(value)) != hash(Err(value))
+
+    assert Ok(value) == ANY  # foreign types get to compare via reflection
+    assert Err(value) == ANY
+
+
+@early_result
+def add_early(left: Result[int, str], right: Result[int, str]) -> Result[int, str]:
+    return Ok(left.early() + right.early())
+
+
+def test_early() -> None:
+    assert add_early(Ok(1), Ok(2)) == Ok(3)
+
+    assert add_early(Err(DIVISION_BY_ZERO), Ok(2)) == Err(DIVISION_BY_ZERO)
+    assert add_early(Ok(1), Err("other")) == Err("other")
+
+
+def test_slots() -> None:
+    assert not hasattr(Ok(42), "__dict__")
+    assert not hasattr(Err(42), "__dict__")
+
+
+def test_is_ok_is_err() -> None:
+    assert is_ok(Ok(42))
+    assert not is_ok(Err(42))
+
+    assert is_err(Err(42))
+    assert not is_err(Ok(42))
+
+
+@wrap_result_on(ValueError)
+def parse(string: str) -> int:
+    return int(string)
+
+
+def test_wrap_result() -> None:
+    assert parse("42") == Ok(42)
+    assert parse("owo").is_err()
+
+    assert parse.__name__ == "parse"
+
+
+@pytest.mark.anyio
+async def test_unwrap_or_else_await() -> None:
+    assert await Ok(1.0).unwrap_or_else_await(default) == 1.0
+    assert await Err(DIVISION_BY_ZERO).unwrap_or_else_await(default) == 0.0
+
+
+def test_immutable() -> None:
+    ok = Ok(42)
+
+    with pytest.raises(AttributeError):
+        ok.value = 13  # type: ignore[misc]
+
+    with pytest.raises(AttributeError):
+        del ok.value
+
+    assert ok.value == 42
+
+
+def test_pickle() -> None:
+    for result in (Ok(42), Err(13)):
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert copy(result) == result
+
+
+def test_match_args() -> None:
+    assert Ok.__match_args__ == ("value",)
+    assert Err.__match_args__ == ("value",)
+
+
+def test_weakref() -> None:
+    for result in (Ok(42), Err(13)):
+        assert ref(result)() is result
+
+
+@pytest.mark.anyio
+async def test_map_await_or() -> None:
+    assert await Ok(2.0).map_await_or(0.0, halve) == 1.0
+    assert await Err(DIVISION_BY_ZERO).map_await_or(0.0, halve) == 0.0
+
+    assert await Err("owo").map_err_await_or(0, length) == 3
+    assert await Ok(2.0).map_err_await_or(0, length) == 0
+
+
+@pytest.mark.anyio
+async def test_map_or_else_await() -> None:
+    assert await Ok("owo").map_or_else_await(zero, len) == 3
+    assert await Err(DIVISION_BY_ZERO).map_or_else_await(zero, len) == 0
+
+    assert await Err("uwu").map_err_or_else_await(zero, len) == 3
+    assert await Ok(DIVISION_BY_ZERO).map_err_or_else_await(zero, len) == 0
+
+
+def fail(string: str) -> int:
+    raise ValueError(string)
+
+
+@pytest.mark.anyio
+async def test_map_or_else_await_lazy() -> None:
+    awaitable = Ok("owo").map_or_else_await(zero, fail)  # nothing is called yet
+
+    with pytest.raises(ValueError):
+        await awaitable
+
+    awaitable = Err("uwu").map_err_or_else_await(zero, fail)
+
+    with pytest.raises(ValueError):
+        await awaitable
+
+
+@pytest.mark.anyio
+async def test_map_await_or_else() -> None:
+    ok = Ok(2.0)
+    err = Err(DIVISION_BY_ZERO)
+
+    assert await err.map_await_or_else(lambda: ok, inverse) == ok
+    assert await ok.map_err_await_or_else(lambda: err, recover) == err
+
+
+@pytest.mark.anyio
+async def test_map_await_or_else_lazy() -> None:
+    awaitable = Err(DIVISION_BY_ZERO).map_await_or_else(divide_by_zero, halve)  # not called yet
+
+    with pytest.raises(ZeroDivisionError):
+        await awaitable
+
+    awaitable = Ok(2.0).map_err_await_or_else(divide_by_zero, length)
+
+    with pytest.raises(ZeroDivisionError):
+        await awaitable
+
+
+def test_try_flatten() -> None:
+    ok: Result[int, str] = Ok(42)
+    err: Result[int, str] = Err("error")
+
+    assert Ok(ok).try_flatten() is ok
+    assert Ok(err).try_flatten() is err
+
+    nested_err: Result[Result[int, str], str] = Err("error")
+
+    assert nested_err.try_flatten() is nested_err
+
+    assert Err(ok).try_flatten_err() is ok
+    assert Err(err).try_flatten_err() is err
+
+    nested_ok: Result[int, Result[int, str]] = Ok(42)
+
+    assert nested_ok.try_flatten_err() is nested_ok
+
+
+@pytest.mark.anyio
+async def test_is_ok_and_await() -> None:
+    assert await Ok(1.0).is_ok_and_await(is_positive)
+    assert await Err(1.0).is_ok_and_await(is_positive) is False
+    assert await Ok(1.0).is_err_and_await(is_positive) is False
+
+
+def test_contains() -> None:
+    nan = float("nan")
+
+    assert Ok(42).contains(42)
+    assert not Ok(42).contains(13)
+    assert Ok(nan).contains(nan)  # identity implies containment, like `in`
+
+    assert Err(nan).contains_err(nan)
+    assert not Err(42).contains(42)
+
+
+@wrap_result_on(ValueError, TypeError)
+def parse_any(value: Any) -> int:
+    return int(value)
+
+
+def test_wrap_result_many() -> None:
+    assert parse_any("42") == Ok(42)
+    assert parse_any("owo").is_err()
+    assert parse_any(None).is_err()
+
+
+async def async_list(result: Result[int, int]) -> List[int]:
+    return [value async for value in result]
+
+
+@pytest.mark.anyio
+async def test_iter() -> None:
+    assert list(Ok(42)) == [42]
+    assert list(Err(42)) == []
+
+    assert await async_list(Ok(42)) == [42]
+    assert await async_list(Err(42)) == []
+
+
+def to_int(value: Any) -> int:
+    return int(value)
+
+
+def test_wrap_result_map() -> None:
+    assert wrap_result_on(ValueError).map(to_int, ["42", "13"]) == [Ok(42), Ok(13)]
+
+    (ok, err) = wrap_result_on(ValueError).map(to_int, ["42", "owo"])
+
+    assert ok == Ok(42)
+    assert err.is_err()
+
+    with pytest.raises(TypeError):
+        wrap_result_on(ValueError).map(to_int, [None])
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from wraps.panics import Panic
+from wraps.result import Err, Ok, Result
+from wraps.result_vec import ERR, OK, ResultVec
+
+ERROR = "error"
+
+
+def test_from_results() -> None:
+    results: List[Result[int, str]] = [Ok(1), Err(ERROR), Ok(3)]
+
+    vec = ResultVec.from_results(results)
+
+    assert len(vec) == len(results)
+
+    assert vec.tags == bytearray((OK, ERR, OK))
+    assert vec.values == [1, ERROR, 3]
+
+    assert list(vec) == results
+    assert vec[1] == Err(ERROR)
+
+
+def test_map() -> None:
+    results: List[Result[int, str]] = [Ok(1), Err(ERROR)]
+
+    vec = ResultVec.from_results(results)
+
+    assert list(vec.map(str)) == [Ok("1"), Err(ERROR)]
+    assert list(vec.map_err(len)) == [Ok(1), Err(len(ERROR))]
+
+
+def test_unwrap_or() -> None:
+    results: List[Result[int, str]] = [Ok(1), Err(ERROR), Ok(3)]
+
+    vec = ResultVec.from_results(results)
+
+    assert vec.unwrap_or(0) == [1, 0, 3]
+
+
+def test_partition() -> None:
+    results: List[Result[int, str]] = [Ok(1), Err(ERROR), Ok(3), Err("other")]
+
+    vec = ResultVec.from_results(results)
+
+    assert vec.partition() == ([1, 3], [ERROR, "other"])
+
+    assert ResultVec().partition() == ([], [])
+
+
+def halve_all(values: List[int]) -> List[float]:
+    return [value / 2 for value in values]
+
+
+def test_map_batch() -> None:
+    results: List[Result[int, str]] = [Ok(2), Err(ERROR), Ok(4)]
+
+    vec = ResultVec.from_results(results)
+
+    assert list(vec.map_batch(halve_all)) == [Ok(1.0), Err(ERROR), Ok(2.0)]
+
+
+def test_map_batch_wrong_length() -> None:
+    results: List[Result[int, str]] = [Ok(2), Err(ERROR), Ok(4)]
+
+    vec = ResultVec.from_results(results)
+
+    with pytest.raises(Panic):
+        vec.map_batch(lambda values: values[:1])
+
+
+def test_invalid() -> None:
+    with pytest.raises(Panic):
+        ResultVec(bytearray((OK, OK)), [1])
+
+    with pytest.raises(Panic):
+        ResultVec(bytearray((2,)), [5])
+
+
+def test_slice() -> None:
+    results: List[Result[int, str]] = [Ok(1), Err(ERROR), Ok(3)]
+
+    vec = ResultVec.from_results(results)
+
+    assert vec[0:2] == ResultVec.from_results(results[0:2])
+    assert list(vec[::2]) == [Ok(1), Ok(3)]